@@ -0,0 +1,90 @@
+import time
+from collections import OrderedDict
+
+
+class Cache:
+    """
+    A minimal TTL + LRU row cache backed by a single OrderedDict.
+
+    Each entry is stored as a (value, expiry) tuple so a lookup costs one
+    dict access plus a monotonic-clock comparison; expired entries are
+    dropped lazily on access. When the cache grows past maxsize the least
+    recently used entry is evicted. A ttl of 0 disables expiry, leaving
+    plain LRU behavior.
+    """
+    __slots__ = ("_data", "maxsize", "ttl")
+
+    def __init__(self, maxsize: int, ttl: float = 0) -> None:
+        self._data = OrderedDict()
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+    def _expiry(self):
+        return time.monotonic() + self.ttl if self.ttl else None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key) -> bool:
+        entry = self._data.get(key)
+        if entry is None:
+            return False
+        if entry[1] is not None and time.monotonic() >= entry[1]:
+            del self._data[key]
+            return False
+        return True
+
+    def __getitem__(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            raise KeyError(key)
+        value, expiry = entry
+        if expiry is not None and time.monotonic() >= expiry:
+            del self._data[key]
+            raise KeyError(key)
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value) -> None:
+        data = self._data
+        data[key] = (value, self._expiry())
+        data.move_to_end(key)
+        if len(data) > self.maxsize:
+            data.popitem(last=False)
+
+    def get(self, key, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        value, expiry = entry
+        if expiry is not None and time.monotonic() >= expiry:
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def update(self, items) -> None:
+        """
+        Inserts many (key, value) pairs with one expiry computation,
+        evicting oldest entries once at the end instead of per item.
+        """
+        if hasattr(items, "items"):
+            items = items.items()
+        data = self._data
+        expiry = self._expiry()
+        for key, value in items:
+            data[key] = (value, expiry)
+            data.move_to_end(key)
+        while len(data) > self.maxsize:
+            data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return default
+        if entry[1] is not None and time.monotonic() >= entry[1]:
+            return default
+        return entry[0]
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -3,6 +3,8 @@ import pgconnect
 
 
 class Column:
+    __slots__ = ("name", "type")
+
     def __init__(
             self,
             name: str,
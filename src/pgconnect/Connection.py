@@ -1,3 +1,4 @@
+import asyncio
 import asyncpg
 import time
 
@@ -13,8 +14,26 @@ class Connection:
             database: str,
             ssl: bool = False,
             pool: int = None,
+            pool_min_size: int = None,
+            max_inactive_connection_lifetime: float = 300.0,
+            max_queries: int = 50000,
+            statement_cache_size: int = 100,
             reconnect: bool = False
     ) -> None:
+        """
+        :param pool: The maximum pool size. None keeps a single connection.
+        :param pool_min_size: How many connections the pool opens up front.
+            Defaults to the pool size capped at 10, so small pools are
+            fully warm and large pools don't open 50 sockets at startup.
+        :param max_inactive_connection_lifetime: Seconds an idle pooled
+            connection may live before being closed and replaced.
+        :param max_queries: Queries served before a pooled connection is
+            recycled.
+        :param statement_cache_size: Size of asyncpg's per-connection
+            prepared-statement cache. Pass 0 to disable statement caching
+            entirely, e.g. when a generic plan misbehaves or when running
+            behind a transaction-mode pooler like PgBouncer.
+        """
         self.host = host
         self.port = port
         self.user = user
@@ -22,8 +41,29 @@ class Connection:
         self.database = database
         self.ssl = ssl
         self.pool = pool
+        self.pool_min_size = pool_min_size if pool_min_size is not None else min(pool or 1, 10)
+        self.max_inactive_connection_lifetime = max_inactive_connection_lifetime
+        self.max_queries = max_queries
+        self.statement_cache_size = statement_cache_size
         self.reconnect = reconnect
+        # In single-connection mode every table shares one socket, so they
+        # all serialize on one lock; a pool hands out independent
+        # connections and needs none. Created lazily in _get_conn_lock so
+        # it binds to the running loop — on Python 3.8/3.9 an eagerly
+        # built asyncio.Lock captures whatever loop exists at construction
+        # and fails later inside asyncio.run() with a different one.
+        self._conn_lock = None
+
 
+    def _get_conn_lock(self):
+        """
+        Returns the lock serializing single-connection access, creating it
+        on first use from inside the running event loop.
+        """
+        lock = self._conn_lock
+        if lock is None:
+            lock = self._conn_lock = asyncio.Lock()
+        return lock
 
     async def get_connection(self):
         if not self.connection:
@@ -39,12 +79,15 @@ class Connection:
         Check the connection to the database
         :return: The time taken to ping the database in milliseconds
         """
-        start_time = time.time_ns()
+        # perf_counter_ns is monotonic, so the measurement can't be skewed
+        # by wall-clock adjustments mid-ping.
+        start_time = time.perf_counter_ns()
         connection = await self.get_connection()
-        await connection.fetchval("SELECT 1")
-        if isinstance(self.connection, asyncpg.pool.Pool):
-            await connection.close()
-        end_time = time.time_ns()
+        try:
+            await connection.fetchval("SELECT 1")
+        finally:
+            await self.release(connection)
+        end_time = time.perf_counter_ns()
         return (end_time - start_time) / 1000000
 
     async def connect(self):
@@ -57,7 +100,11 @@ class Connection:
                     password=self.password,
                     database=self.database,
                     ssl=self.ssl,
-                    max_size=self.pool
+                    min_size=self.pool_min_size,
+                    max_size=self.pool,
+                    max_inactive_connection_lifetime=self.max_inactive_connection_lifetime,
+                    max_queries=self.max_queries,
+                    statement_cache_size=self.statement_cache_size
                 )
             else:
                 connection = await asyncpg.connect(
@@ -66,7 +113,8 @@ class Connection:
                     user=self.user,
                     password=self.password,
                     database=self.database,
-                    ssl=self.ssl
+                    ssl=self.ssl,
+                    statement_cache_size=self.statement_cache_size
                 )
             self.connection = connection
         except Exception as e:
@@ -80,10 +128,43 @@ class Connection:
     
     async def release(self, connection):
         """
-        Release a connection back to the pool
+        Release a connection back to the pool. Closing it instead would
+        tear down the socket and force a fresh handshake on next acquire.
         """
         if isinstance(self.connection, asyncpg.pool.Pool):
-            await connection.close()
+            await self.connection.release(connection)
+
+    async def create_all(self, tables):
+        """
+        Creates several tables concurrently. With a pool each create runs
+        on its own connection, so the round-trips overlap instead of
+        running one after another.
+
+        :param tables: The Table objects to create.
+        :return: The per-table results, in order.
+        """
+        return await asyncio.gather(*(table.create() for table in tables))
+
+    async def truncate_all(self, tables):
+        """
+        Truncates several tables concurrently. For tables on the same
+        database, Table.truncate_many does the same in a single statement
+        and is usually the better choice.
+
+        :param tables: The Table objects to truncate.
+        :return: The per-table results, in order.
+        """
+        return await asyncio.gather(*(table.truncate() for table in tables))
+
+    async def drop_all(self, tables):
+        """
+        Drops several tables concurrently. For tables on the same
+        database, Table.drop_many batches the statements instead.
+
+        :param tables: The Table objects to drop.
+        :return: The per-table results, in order.
+        """
+        return await asyncio.gather(*(table.drop() for table in tables))
 
     async def close(self):
         """
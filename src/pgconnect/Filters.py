@@ -0,0 +1,91 @@
+class Filter:
+    """
+    Base class for non-equality WHERE conditions. Filters render their own
+    SQL fragment with placeholders numbered past the parameters already
+    bound, so clauses compose without renumbering.
+
+    Filters are accepted in the ``where=`` dict of :meth:`Table.search`,
+    :meth:`Table.search_iter`, :meth:`Table.search_with_count` and
+    :meth:`Table.count_search`. The keyword conditions of the CRUD
+    methods (``get``/``gets``/``select``/``delete``/``update``) are
+    equality-only and do not accept Filter instances.
+    """
+    __slots__ = ()
+
+    def sql(self, column: str, start_index: int) -> str:
+        """
+        Returns the SQL fragment for the condition on the given column.
+
+        :param column: The column the condition applies to.
+        :param start_index: The number of parameters already bound.
+        """
+        raise NotImplementedError
+
+    def values(self) -> list:
+        """
+        Returns the parameter values bound by the condition, in placeholder order.
+        """
+        raise NotImplementedError
+
+
+class Between(Filter):
+    """
+    Matches values between two bounds (inclusive).
+    """
+    __slots__ = ("low", "high")
+
+    def __init__(self, low, high) -> None:
+        self.low = low
+        self.high = high
+
+    def sql(self, column: str, start_index: int) -> str:
+        return f"{column} BETWEEN ${start_index + 1} AND ${start_index + 2}"
+
+    def values(self) -> list:
+        return [self.low, self.high]
+
+    def __repr__(self) -> str:
+        return f"<Between {self.low!r} AND {self.high!r}>"
+
+
+class Like(Filter):
+    """
+    Matches values against a SQL LIKE pattern. Case-insensitive (ILIKE)
+    by default.
+    """
+    __slots__ = ("pattern", "case_sensitive")
+
+    def __init__(self, pattern: str, case_sensitive: bool = False) -> None:
+        self.pattern = pattern
+        self.case_sensitive = case_sensitive
+
+    def sql(self, column: str, start_index: int) -> str:
+        operator = "LIKE" if self.case_sensitive else "ILIKE"
+        return f"{column} {operator} ${start_index + 1}"
+
+    def values(self) -> list:
+        return [self.pattern]
+
+    def __repr__(self) -> str:
+        return f"<Like {self.pattern!r}>"
+
+
+class In(Filter):
+    """
+    Matches values contained in a collection. Binds the collection as a
+    single array parameter, so the statement text is stable regardless of
+    how many choices are passed.
+    """
+    __slots__ = ("choices",)
+
+    def __init__(self, choices) -> None:
+        self.choices = list(choices)
+
+    def sql(self, column: str, start_index: int) -> str:
+        return f"{column} = ANY(${start_index + 1})"
+
+    def values(self) -> list:
+        return [self.choices]
+
+    def __repr__(self) -> str:
+        return f"<In {self.choices!r}>"
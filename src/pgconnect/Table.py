@@ -1,12 +1,53 @@
 import asyncpg
-import traceback
+import json
+import logging
+import re
+import time
 from .Column import Column
+from .Filters import Filter
 from typing import Optional, List, Any, Dict
 from pgconnect import Connection
-from cachetools import TTLCache
+from .Cache import Cache
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 import asyncio
 
+logger = logging.getLogger(__name__)
+
+# Matches valid unquoted SQL identifiers; compiled once so validation on
+# the hot path is a single C-level call.
+_IDENT = re.compile(r"[A-Za-z_][A-Za-z0-9_]*").fullmatch
+
+# Sentinel cached by get() for keys known to be absent, so repeated
+# lookups for a missing row are answered without a round-trip.
+_MISS = object()
+
+# The only order directions ever embedded into SQL; anything else raises.
+_ORDERS = frozenset((
+    "ASC", "DESC",
+    "ASC NULLS FIRST", "ASC NULLS LAST",
+    "DESC NULLS FIRST", "DESC NULLS LAST",
+))
+
+
+def _coerce_int(value):
+    return int(value) if isinstance(value, str) else value
+
+
+def _coerce_bool(value):
+    return value.lower() in ("true", "1", "yes") if isinstance(value, str) else value
+
 class Table:
+    __slots__ = (
+        "name", "connection", "columns", "cache", "cache_key", "cache_ttl",
+        "cache_maxsize", "cache_insert_threshold", "caches", "timeout",
+        "_is_pool",
+        "_stmt_cache", "_sql_cache", "_insert_sql_cache", "_column_names",
+        "_column_name_set", "_columns_by_name", "_col_index", "_text_cols", "_coercers",
+        "_columns_cache", "_columns_ttl", "_quoted_name", "_quoted_columns", "_sql_select_prefix",
+        "_sql_count_prefix", "_sql_exists_prefix", "_truncate_sql", "_drop_sql",
+    )
+
     def __init__(
             self,
             name: str,
@@ -15,7 +56,10 @@ class Table:
             cache: bool = False,
             cache_key: Optional[str] = None,
             cache_ttl: Optional[int] = None,  # Change to Optional[int]
-            cache_maxsize: int = 1000
+            cache_maxsize: int = 1000,
+            cache_insert_threshold: int = 32,
+            columns_ttl: int = 60,
+            timeout: Optional[float] = 5
     ) -> None:
         """
         Initializes the Table object.
@@ -26,21 +70,89 @@ class Table:
         :param cache: Whether to enable caching.
         :param cache_key: The key to use for caching.
         :param cache_ttl: The time-to-live for cache entries in seconds.
+            None (the default) keeps entries until LRU eviction; passing 0
+            raises, since it would silently disable expiry.
         :param cache_maxsize: The maximum size of the cache.
+        :param cache_insert_threshold: The largest result set a multi-row
+            read may admit into the cache. Bigger results are returned
+            without caching so a single scan cannot evict every hot key.
+        :param columns_ttl: How many seconds get_columns may serve its
+            memoized result before hitting information_schema again.
+        :param timeout: Per-query timeout in seconds. None disables the
+            timeout, which also saves asyncpg from scheduling and
+            cancelling a timer handle on every call.
         """
+        if not _IDENT(name):
+            raise ValueError(f"Invalid table name: {name}")
+        for column in columns:
+            if not _IDENT(column.name):
+                raise ValueError(f"Invalid column name: {column.name}")
         self.name = name
         self.connection: Connection = connection
         self.columns = columns
         self.cache = cache
         self.cache_key = cache_key
-        self.cache_ttl = cache_ttl if cache_ttl is not None else 0  # Ensure cache_ttl is a valid number
+        if cache_ttl is not None and cache_ttl <= 0:
+            raise ValueError("cache_ttl must be positive; pass cache_ttl=None for a plain LRU cache without expiry")
+        self.cache_ttl = cache_ttl if cache_ttl is not None else 0  # 0 internally means "no expiry"
         self.cache_maxsize = cache_maxsize
-        self._conn = None  # Initialize the connection attribute
+        self.cache_insert_threshold = cache_insert_threshold
+        self._columns_ttl = columns_ttl
+        self._is_pool = bool(connection.pool)  # Fixed for the connection's lifetime
         if cache and not cache_key:
             raise ValueError("cache_key must be provided if cache is enabled")
         
-        self.caches = TTLCache(maxsize=cache_maxsize, ttl=self.cache_ttl) if cache else None
-        self.timeout = 5  # Set the timeout to 5 seconds
+        self.caches = Cache(maxsize=cache_maxsize, ttl=self.cache_ttl) if cache else None
+        self._stmt_cache = OrderedDict()  # Prepared statements keyed by query shape
+        self._sql_cache = {}  # Memoized SQL fragments keyed by clause shape
+        # Quoted once here so every query site is safe for case-sensitive
+        # identifiers without re-validating per call.
+        self._quoted_name = '"' + name.replace('"', '""') + '"'
+        # Constant query prefixes, built once per table.
+        self._sql_select_prefix = f"SELECT * FROM {self._quoted_name} WHERE "
+        self._sql_count_prefix = f"SELECT COUNT(*) FROM {self._quoted_name} WHERE "
+        self._sql_exists_prefix = f"SELECT EXISTS (SELECT 1 FROM {self._quoted_name} WHERE "
+        # DDL with no per-call variation; a stable string also keeps
+        # asyncpg's statement cache keyed consistently.
+        self._truncate_sql = f"TRUNCATE TABLE {self._quoted_name};"
+        self._drop_sql = f"DROP TABLE IF EXISTS {self._quoted_name};"
+        self._refresh_column_lookups()
+        self.timeout = timeout
+
+    def _refresh_column_lookups(self):
+        """
+        Rebuilds the precomputed column lookups. The columns are static
+        between schema mutations, so hot paths can use these instead of
+        scanning the column list on every call.
+        """
+        self._column_names = tuple(column.name for column in self.columns)
+        self._column_name_set = frozenset(self._column_names)
+        self._columns_by_name = {column.name: column for column in self.columns}
+        # Schema column names are validated in __init__, so they can be
+        # quoted once here and looked up by the SQL builders.
+        self._quoted_columns = {name: f'"{name}"' for name in self._column_names}
+        self._col_index = {column.name: i for i, column in enumerate(self.columns)}
+        self._text_cols = frozenset(
+            column.name for column in self.columns
+            if getattr(column.type, "type_name", "").startswith(("TEXT", "VARCHAR", "CHAR"))
+        )
+        # String->value coercers for get(), keyed by column name; columns
+        # that never need coercion stay out of the dict entirely.
+        coercers = {}
+        for column in self.columns:
+            type_name = getattr(column.type, "type_name", "")
+            if type_name in ("INTEGER", "BIGINT", "SMALLINT", "SERIAL", "BIGSERIAL", "SMALLSERIAL"):
+                coercers[column.name] = _coerce_int
+            elif type_name == "BOOLEAN":
+                coercers[column.name] = _coerce_bool
+        self._coercers = coercers
+        self._insert_sql_cache = {}  # Insert SQL keyed by kwargs shape; schema-dependent
+        self._columns_cache = None  # Memoized get_columns result
+        # Statements prepared against the old schema are stale, and so are
+        # memoized fragments that depend on column types.
+        self._stmt_cache.clear()
+        self._sql_cache.clear()
+
     def clear_cache(self):
         """
         Clears the cache for the table.
@@ -49,17 +161,184 @@ class Table:
             raise ValueError("Cache is not enabled")
         self.caches.clear()
 
-    async def _get_connection(self):
-        return await self.connection.get_connection()
+    @asynccontextmanager
+    async def _acquire(self):
+        """
+        Acquires a connection for the duration of a single operation.
+
+        Pooled connections are acquired from and released back to the pool,
+        so concurrent callers each get their own connection instead of
+        serializing on one socket. The single persistent connection is
+        guarded by a lock so concurrent operations queue instead of
+        stepping on each other's transactions.
+
+        The release in the finally block only runs once a connection has
+        actually been acquired, so a failure inside get_connection()
+        propagates as-is instead of being masked by an UnboundLocalError
+        on the release path.
+        """
+        connection = await self.connection.get_connection()
+        if self._is_pool:
+            try:
+                yield connection
+            finally:
+                await self.connection.connection.release(connection)
+        else:
+            # Serialize access to the single connection with a lock instead
+            # of polling is_in_transaction() with sleeps: waiters are woken
+            # the moment the holder finishes, not up to a second later. The
+            # lock lives on the Connection, shared by every table on it.
+            async with self.connection._get_conn_lock():
+                yield connection
+
+    async def _prepare_cached(self, connection, key, query):
+        """
+        Returns a cached prepared statement for the query, preparing it on
+        first use so repeated calls skip SQL parse/plan overhead.
+
+        Only applies on the single persistent connection; pooled connections
+        change between calls, so pooled queries rely on asyncpg's own
+        per-connection statement cache instead and get None here.
+        """
+        if self._is_pool:
+            return None
+        statement = self._stmt_cache.get(key)
+        if statement is None:
+            statement = await connection.prepare(query)
+            self._stmt_cache[key] = statement
+            if len(self._stmt_cache) > 256:
+                self._stmt_cache.popitem(last=False)
+        else:
+            self._stmt_cache.move_to_end(key)
+        return statement
+
+    def _q(self, name):
+        """
+        Returns the quoted form of a column identifier. Schema columns hit
+        the precomputed lookup; anything else is validated before quoting,
+        so ad-hoc identifiers can never smuggle SQL into a query.
+        """
+        quoted = self._quoted_columns.get(name)
+        if quoted is None:
+            if not _IDENT(name):
+                raise ValueError(f"Invalid column name: {name}")
+            quoted = f'"{name}"'
+        return quoted
+
+    def _where_sql(self, keys):
+        """
+        Returns the memoized WHERE clause for a tuple of keys, so repeated
+        call shapes pay the string formatting exactly once.
+        """
+        if not keys:
+            return "1=1"
+        clause = self._sql_cache.get(keys)
+        if clause is None:
+            clause = " AND ".join(f"{self._q(key)} = ${i+1}" for i, key in enumerate(keys))
+            self._sql_cache[keys] = clause
+        return clause
+
+    def _build_where_clause(self, where, start_index: int = 0):
+        """
+        Builds a WHERE clause and its parameter list from a filter dict.
+
+        Placeholders are numbered from ``$start_index + 1``, so the clause
+        can be appended after parameters that are already bound without any
+        renumbering pass afterwards.
+
+        Values may be plain values (equality) or :class:`Filter` instances
+        such as ``Between``, ``Like`` and ``In``. The common all-equality
+        case is handled without any per-key isinstance checks.
+
+        :param where: A dictionary of column -> value (or Filter) conditions.
+        :param start_index: The number of parameters already bound.
+        :return: A (clause, values) tuple.
+        """
+        if not where:
+            return "1=1", []
+        values = list(where.values())
+        has_filter = False
+        for value in values:
+            if isinstance(value, Filter):
+                has_filter = True
+                break
+        if not has_filter:
+            conditions = [f"{self._q(key)} = ${start_index + i + 1}" for i, key in enumerate(where)]
+            return " AND ".join(conditions), values
+
+        conditions = []
+        params = []
+        index = start_index
+        for key, value in where.items():
+            if isinstance(value, Filter):
+                conditions.append(value.sql(self._q(key), index))
+                filter_values = value.values()
+                params.extend(filter_values)
+                index += len(filter_values)
+            else:
+                index += 1
+                conditions.append(f"{self._q(key)} = ${index}")
+                params.append(value)
+        return " AND ".join(conditions), params
+
+    def _page_sql(self, order_by=None, order='ASC', limit=None, offset=None):
+        """
+        Builds the trailing ORDER BY/LIMIT/OFFSET clause for read queries.
+        order is checked against a whitelist and limit and offset are
+        coerced to int, so every embedded piece is safe.
+        """
+        suffix = ""
+        if order_by:
+            direction = " ".join(order.upper().split()) if order else "ASC"
+            if direction not in _ORDERS:
+                raise ValueError(f"Invalid order direction: {order}")
+            suffix += f" ORDER BY {self._q(order_by)} {direction}"
+        if limit is not None:
+            suffix += f" LIMIT {int(limit)}"
+        if offset is not None:
+            suffix += f" OFFSET {int(offset)}"
+        return suffix
+
+    def _columns_clause(self, columns):
+        """
+        Returns the memoized projection clause for a tuple of column names,
+        validating the identifiers once per distinct shape.
+        """
+        if not columns:
+            return "*"
+        key = ("columns", columns)
+        clause = self._sql_cache.get(key)
+        if clause is None:
+            clause = ", ".join(self._q(column) for column in columns)
+            self._sql_cache[key] = clause
+        return clause
 
     def _get_cache_key(self, **kwargs):
         """
         Generates a string cache key from the provided keyword arguments.
+        Returns None when no cache key is configured, when the configured
+        key is not a table column, or when its value is missing.
+        """
+        cache_key = self.cache_key
+        if cache_key is None or cache_key not in self._column_name_set:
+            return None
+        value = kwargs.get(cache_key)
+        if value is None:
+            return None
+        return str(value)
+
+    def _cache_key_of(self, row):
         """
-        if self.cache_key:
-            if self.cache_key in [column.name for column in self.columns]:
-                return str(kwargs.get(self.cache_key))
-        return None
+        Like :meth:`_get_cache_key` but reads straight from a row mapping,
+        avoiding the dict copy that a ``**row`` splat would create.
+        """
+        cache_key = self.cache_key
+        if cache_key is None or cache_key not in self._column_name_set:
+            return None
+        value = row.get(cache_key)
+        if value is None:
+            return None
+        return str(value)
 
     async def create(self):
         """
@@ -67,66 +346,111 @@ class Table:
         it will add new columns and drop removed columns based on the current schema.
         """
         try:
-            connection = await self._get_connection()
-            # if connection is busy wait 1 second and try again
-            if not isinstance(self.connection.connection, asyncpg.pool.Pool):
-                for i in range(5):
-                    if connection.is_in_transaction():
-                        await asyncio.sleep(1)
-                    else:
-                        break
-                if connection.is_in_transaction():
-                    raise Exception("Connection is busy")
-            table_exists_query = f"""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables 
-                WHERE table_schema = 'public' 
-                AND table_name = '{self.name}'
-            );
-            """
-            table_exists = await connection.fetchval(table_exists_query, timeout=self.timeout)
-            
-            if table_exists:
-                existing_columns_query = f"""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name = '{self.name}';
-                """
-                existing_columns = await connection.fetch(existing_columns_query, timeout=self.timeout)
-                existing_column_names = {row['column_name'] for row in existing_columns}
-                
-                alter_table_queries = []
-                new_column_names = {column.name for column in self.columns}
-                
-                for column in self.columns:
-                    if column.name not in existing_column_names:
-                        alter_table_queries.append(f"ALTER TABLE {self.name} ADD COLUMN {column.name} {column.type};")
-                
-                for existing_column in existing_column_names:
-                    if existing_column not in new_column_names:
-                        alter_table_queries.append(f"ALTER TABLE {self.name} DROP COLUMN {existing_column};")
-                
-                for query in alter_table_queries:
+            async with self._acquire() as connection:
+                # The whole schema sync runs in one transaction so the
+                # introspection and the DDL it decides on are applied as a
+                # single atomic batch.
+                async with connection.transaction():
+                    # One row answers both "does the table exist" and "which
+                    # columns does it have": a single round-trip, and the
+                    # column names come back as one array instead of N
+                    # Record objects.
+                    introspection_query = """
+                    SELECT
+                        EXISTS (
+                            SELECT 1 FROM information_schema.tables
+                            WHERE table_schema = 'public' AND table_name = $1
+                        ) AS table_exists,
+                        COALESCE(
+                            (SELECT array_agg(column_name)
+                             FROM information_schema.columns
+                             WHERE table_name = $1),
+                            '{}'
+                        ) AS column_names;
+                    """
+                    introspection = await connection.fetchrow(introspection_query, self.name, timeout=self.timeout)
+                    table_exists = introspection['table_exists']
+
+                    if table_exists:
+                        existing_column_names = set(introspection['column_names'])
+
+                        alter_table_actions = []
+                        new_column_names = self._column_name_set
+
+                        for column in self.columns:
+                            if column.name not in existing_column_names:
+                                alter_table_actions.append(f"ADD COLUMN {column.name} {column.type}")
+
+                        for existing_column in existing_column_names:
+                            if existing_column not in new_column_names:
+                                alter_table_actions.append(f"DROP COLUMN {existing_column}")
+
+                        # PostgreSQL accepts multiple actions in one ALTER TABLE, so all
+                        # schema changes cost a single round-trip instead of one each.
+                        if alter_table_actions:
+                            alter_table_query = f"ALTER TABLE {self._quoted_name} " + ", ".join(alter_table_actions) + ";"
+                            await connection.execute(alter_table_query, timeout=self.timeout)
+                            # Statements prepared against the old schema are stale.
+                            self._stmt_cache.clear()
+                            self._columns_cache = None
+                        return
+
+                    query = f"CREATE TABLE IF NOT EXISTS {self._quoted_name} (\n"
+                    column_definitions = []
+                    for column in self.columns:
+                        column: Column
+                        column_definitions.append(f"{column.name} {column.type}")
+                    query += ",\n".join(column_definitions) + "\n);"
                     await connection.execute(query, timeout=self.timeout)
-                return
-
-            query = f"CREATE TABLE IF NOT EXISTS {self.name} (\n"
-            column_definitions = []
-            for column in self.columns:
-                column: Column
-                column_definitions.append(f"{column.name} {column.type}")
-            query += ",\n".join(column_definitions) + "\n);"
-            await connection.execute(query, timeout=self.timeout)
         except asyncpg.PostgresError as e:
-            print(f"Failed to create table {self.name}: {e}")
+            logger.error("Failed to create table %s: %s", self.name, e)
             return None
-        except Exception as e:
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("Unexpected error on table %s", self.name)
             return None
-        finally:
-            if connection and isinstance(self.connection.connection, asyncpg.pool.Pool):
-                await connection.close()
-        
+    async def ensure_trgm_index(self, columns: List[str]):
+        """
+        Creates trigram GIN indexes on the given columns so the ILIKE
+        '%keyword%' patterns generated by :meth:`search` can use an index
+        lookup instead of sequentially scanning every searched column.
+
+        Enables the pg_trgm extension if it is missing. Non-text columns
+        are indexed on their ``::text`` cast, matching the expression
+        search() emits for them.
+
+        :param columns: The columns to index.
+        :raises RuntimeError: If there is a database error.
+        :return: True on success.
+        """
+        try:
+            for column in columns:
+                if not _IDENT(column):
+                    raise ValueError(f"Invalid column name: {column}")
+            statements = ["CREATE EXTENSION IF NOT EXISTS pg_trgm;"]
+            for column in columns:
+                if column in self._text_cols:
+                    expression = column
+                else:
+                    expression = f"({column}::text)"
+                statements.append(
+                    f"CREATE INDEX IF NOT EXISTS {self.name}_{column}_trgm_idx "
+                    f"ON {self._quoted_name} USING gin ({expression} gin_trgm_ops);"
+                )
+            async with self._acquire() as connection:
+                # One execute carries all statements, so N indexes cost a
+                # single round-trip.
+                await connection.execute("\n".join(statements), timeout=self.timeout)
+            return True
+        except asyncpg.PostgresError as e:
+            logger.error("Failed to create trigram indexes on table %s: %s", self.name, e)
+            return None
+        except ValueError as e:
+            logger.error("ValueError: %s", e)
+            return None
+        except Exception:
+            logger.exception("Unexpected error on table %s", self.name)
+            return None
+
     async def insert(self, **kwargs):
         """
         Inserts a row into the table.
@@ -136,47 +460,109 @@ class Table:
         :raises RuntimeError: If there is a database error.
         """
         try:
-            filtered_columns = [column for column in self.columns if column.name in kwargs]
-            if not filtered_columns:
-                raise ValueError("No valid columns provided")
-
-            columns = ", ".join(column.name for column in filtered_columns)
-            values = ", ".join(f"${i+1}" for i in range(len(filtered_columns)))
-            query = f"INSERT INTO {self.name} ({columns}) VALUES ({values}) RETURNING *"
-            
-            query_values = [kwargs[column.name] for column in filtered_columns]
-
-            connection = await self._get_connection()
-            # if connection is busy wait 1 second and try again
-            if not isinstance(self.connection.connection, asyncpg.pool.Pool):
-                for i in range(5):
-                    if connection.is_in_transaction():
-                        await asyncio.sleep(1)
-                    else:
-                        break
-                if connection.is_in_transaction():
-                    raise Exception("Connection is busy")
+            shape = frozenset(kwargs)
+            cached = self._insert_sql_cache.get(shape)
+            if cached is None:
+                names, placeholders = [], []
+                index = 1
+                for name in kwargs:
+                    if name in self._column_name_set:
+                        names.append(name)
+                        placeholders.append(f"${index}")
+                        index += 1
+                if not names:
+                    raise ValueError("No valid columns provided")
+                quoted = self._quoted_columns
+                query = f"INSERT INTO {self._quoted_name} ({', '.join(quoted[name] for name in names)}) VALUES ({', '.join(placeholders)}) RETURNING *"
+                cached = (query, names)
+                self._insert_sql_cache[shape] = cached
+            query, names = cached
+            query_values = [kwargs[name] for name in names]
 
-            row = await connection.fetchrow(query, *query_values, timeout=self.timeout)
+            async with self._acquire() as connection:
+                statement = await self._prepare_cached(connection, ("insert", tuple(sorted(kwargs))), query)
+                if statement is not None:
+                    row = await statement.fetchrow(*query_values, timeout=self.timeout)
+                else:
+                    row = await connection.fetchrow(query, *query_values, timeout=self.timeout)
 
             if self.cache:
-                cache_key = self._get_cache_key(**row)
+                cache_key = self._cache_key_of(row)
                 if cache_key:
                     self.caches[cache_key] = row
-
             return row
         except asyncpg.PostgresError as e:
-            print(f"Failed to insert into table {self.name}: {e}")
+            logger.error("Failed to insert into table %s: %s", self.name, e)
+            return None
+        except ValueError as e:
+            logger.error("ValueError: %s", e)
+            return None
+        except Exception:
+            logger.exception("Unexpected error on table %s", self.name)
+            return None
+
+
+    async def insert_many(self, rows: List[Dict[str, Any]], columns: Optional[List[str]] = None, copy_threshold: int = 100):
+        """
+        Inserts multiple rows into the table in a single round-trip.
+
+        Batches of ``copy_threshold`` or more go through PostgreSQL's COPY
+        protocol (``copy_records_to_table``), which skips per-row
+        parse/plan cost; smaller batches use ``executemany`` with one
+        prepared statement.
+
+        :param rows: A list of dictionaries mapping column names to values.
+        :param columns: The columns to insert. Defaults to the keys of the
+            first row that match the table schema.
+        :param copy_threshold: The batch size at which COPY takes over
+            from executemany.
+        :raises ValueError: If no rows or no valid columns are provided.
+        """
+        try:
+            if not rows:
+                raise ValueError("No rows provided")
+
+            if columns is None:
+                columns = [name for name in rows[0] if name in self._column_name_set]
+            if not columns:
+                raise ValueError("No valid columns provided")
+
+            records = [tuple(row.get(column) for column in columns) for row in rows]
+
+            async with self._acquire() as connection:
+                if len(records) >= copy_threshold:
+                    await connection.copy_records_to_table(
+                        self.name,
+                        records=records,
+                        columns=columns,
+                        timeout=self.timeout
+                    )
+                else:
+                    placeholders = ", ".join(f"${i+1}" for i in range(len(columns)))
+                    query = f"INSERT INTO {self._quoted_name} ({', '.join(self._q(column) for column in columns)}) VALUES ({placeholders})"
+                    await connection.executemany(query, records, timeout=self.timeout)
+
+            # The input dicts are not cached: they lack server-side defaults
+            # (SERIAL ids, DEFAULT NOW() timestamps) that every other cache
+            # path gets back from the database. Rows are admitted on first
+            # read instead — but any stale entry for an inserted key, in
+            # particular a negative-cache _MISS left by an earlier get(),
+            # must be evicted or that first read never reaches the database.
+            if self.cache and self.cache_key in columns:
+                key_index = columns.index(self.cache_key)
+                for record in records:
+                    if record[key_index] is not None:
+                        self.caches.pop(str(record[key_index]), None)
+            return len(records)
+        except asyncpg.PostgresError as e:
+            logger.error("Failed to insert rows into table %s: %s", self.name, e)
             return None
         except ValueError as e:
-            print(f"ValueError: {e}")
+            logger.error("ValueError: %s", e)
             return None
-        except Exception as e:
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("Unexpected error on table %s", self.name)
             return None
-        finally:
-            if connection and isinstance(self.connection.connection, asyncpg.pool.Pool):
-                await connection.close()
 
 
     async def update(self, where: Dict[str, Any], **kwargs):
@@ -189,53 +575,65 @@ class Table:
         :raises RuntimeError: If there is a database error.
         """
         try:
-            filtered_columns = [column for column in self.columns if column.name in kwargs]
-            if not filtered_columns:
+            set_parts, query_values = [], []
+            index = 1
+            quoted = self._quoted_columns
+            for name in kwargs:
+                if name in self._column_name_set:
+                    set_parts.append(f"{quoted[name]} = ${index}")
+                    query_values.append(kwargs[name])
+                    index += 1
+            if not set_parts:
                 raise ValueError("No valid columns provided")
 
-            set_clause = ", ".join(f"{column.name} = ${i+1}" for i, column in enumerate(filtered_columns))
-            where_clause = " AND ".join(f"{key} = ${len(filtered_columns) + i + 1}" for i, key in enumerate(where.keys()))
-            query = f"UPDATE {self.name} SET {set_clause} WHERE {where_clause} RETURNING *"
-            
-            query_values = [kwargs[column.name] for column in filtered_columns] + list(where.values())
-
-            connection = await self._get_connection()
-            # if connection is busy wait 1 second and try again
-            if not isinstance(self.connection.connection, asyncpg.pool.Pool):
-                for i in range(5):
-                    if connection.is_in_transaction():
-                        await asyncio.sleep(1)
-                    else:
-                        break
-                if connection.is_in_transaction():
-                    raise Exception("Connection is busy")
-            rows = await connection.fetch(query, *query_values, timeout=self.timeout)
+            where_parts = []
+            for key in where:
+                where_parts.append(f"{self._q(key)} = ${index}")
+                query_values.append(where[key])
+                index += 1
 
-            if self.cache:
-                for row in rows:
-                    cache_key = self._get_cache_key(**row)
-                    if cache_key:
-                        self.caches[cache_key] = row
+            query = f"UPDATE {self._quoted_name} SET {', '.join(set_parts)} WHERE {' AND '.join(where_parts)} RETURNING *"
+
+            async with self._acquire() as connection:
+                # Keyed on insertion order: the SET clause and the bound
+                # values are built in kwargs order, so two calls with the
+                # same columns in different order are different statements.
+                statement = await self._prepare_cached(connection, ("update", tuple(kwargs), tuple(where)), query)
+                if statement is not None:
+                    rows = await statement.fetch(*query_values, timeout=self.timeout)
+                else:
+                    rows = await connection.fetch(query, *query_values, timeout=self.timeout)
 
+            if self.cache and rows and self.cache_key in rows[0].keys():
+                cache_key_name = self.cache_key
+                if len(rows) <= self.cache_insert_threshold:
+                    self.caches.update((str(row[cache_key_name]), row) for row in rows)
+                else:
+                    # The admission cap only protects reads from scan
+                    # pollution; a write must never leave pre-update rows
+                    # behind, so past the cap the touched keys are evicted.
+                    for row in rows:
+                        self.caches.pop(str(row[cache_key_name]), None)
             return rows
         except asyncpg.PostgresError as e:
-            print(f"Failed to update table {self.name}: {e}")
+            logger.error("Failed to update table %s: %s", self.name, e)
             return None
         except ValueError as e:
-            print(f"ValueError: {e}")
+            logger.error("ValueError: %s", e)
             return None
-        except Exception as e:
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("Unexpected error on table %s", self.name)
             return None
-        finally:
-            if connection and isinstance(self.connection.connection, asyncpg.pool.Pool):
-                await connection.close()
 
                 
-    async def delete(self, **where):
+    async def delete(self, returning: bool = True, **where):
         """
         Deletes rows from the table.
 
+        :param returning: Whether to return the deleted rows. When False,
+            only the cache key column is transferred for cache invalidation
+            (or nothing at all when caching is disabled), which avoids
+            shipping every column of every deleted row across the wire.
         :param where: A dictionary specifying the conditions for the rows to delete.
         :raises ValueError: If no conditions are provided.
         :raises RuntimeError: If there is a database error.
@@ -244,91 +642,91 @@ class Table:
             if not where:
                 raise ValueError("No conditions provided for delete")
 
-            where_clause = " AND ".join(f"{key} = ${i+1}" for i, key in enumerate(where.keys()))
-            query = f"DELETE FROM {self.name} WHERE {where_clause} RETURNING *"
-            
-            query_values = list(where.values())
-
-            connection = await self._get_connection()
-            # if connection is busy wait 1 second and try again
-            if not isinstance(self.connection.connection, asyncpg.pool.Pool):
-                for i in range(5):
-                    if connection.is_in_transaction():
-                        await asyncio.sleep(1)
-                    else:
-                        break
-                if connection.is_in_transaction():
-                    raise Exception("Connection is busy")
-            rows = await connection.fetch(query, *query_values, timeout=self.timeout)
+            where_clause = self._where_sql(tuple(where))
+            if returning:
+                query = f"DELETE FROM {self._quoted_name} WHERE {where_clause} RETURNING *"
+            elif self.cache and self.cache_key:
+                query = f"DELETE FROM {self._quoted_name} WHERE {where_clause} RETURNING {self._q(self.cache_key)}"
+            else:
+                query = f"DELETE FROM {self._quoted_name} WHERE {where_clause}"
 
-            if self.cache:
-                for row in rows:
-                    cache_key = self._get_cache_key(**row)
-                    if cache_key and cache_key in self.caches:
-                        del self.caches[cache_key]
+            query_values = where.values()
 
-            return rows
+            async with self._acquire() as connection:
+                if not returning and not (self.cache and self.cache_key):
+                    await connection.execute(query, *query_values, timeout=self.timeout)
+                    return None
+
+                statement = await self._prepare_cached(connection, ("delete", tuple(where), returning), query)
+                if statement is not None:
+                    rows = await statement.fetch(*query_values, timeout=self.timeout)
+                else:
+                    rows = await connection.fetch(query, *query_values, timeout=self.timeout)
+
+            if self.cache and self.cache_key:
+                for row in rows:
+                    if self.cache_key in row.keys():
+                        self.caches.pop(str(row[self.cache_key]), None)
+            return rows if returning else None
         except asyncpg.PostgresError as e:
-            print(f"Failed to delete from table {self.name}: {e}")
+            logger.error("Failed to delete from table %s: %s", self.name, e)
             return None
         except ValueError as e:
-            print(f"ValueError: {e}")
+            logger.error("ValueError: %s", e)
             return None
-        except Exception as e:
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("Unexpected error on table %s", self.name)
             return None
-        finally:
-            if connection and isinstance(self.connection.connection, asyncpg.pool.Pool):
-                await connection.close()
 
                 
-    async def select(self, *columns, **where):
+    async def select(self, *columns, limit: Optional[int] = None, offset: Optional[int] = None, order_by: Optional[str] = None, order: str = 'ASC', **where):
         """
         Selects rows from the table.
 
         :param columns: The columns to select.
+        :param limit: The maximum number of rows to return.
+        :param offset: The number of rows to skip.
+        :param order_by: The column to order the results by.
+        :param order: The order direction ('ASC' or 'DESC').
         :param where: A dictionary specifying the conditions for the rows to select.
         :raises RuntimeError: If there is a database error.
         :return: The selected rows.
         """
         try:
+            # Only honor cache hits for plain full-row selects; a cached row
+            # may lack columns requested by a projection.
             cache_key = self._get_cache_key(**where)
-            if self.cache and cache_key and cache_key in self.caches:
-                return [self.caches[cache_key]]
+            if self.cache and not columns and limit is None and offset is None and order_by is None and cache_key:
+                cached = self.caches.get(cache_key)
+                if cached is not None and cached is not _MISS:
+                    return [cached]
 
-            columns_clause = ", ".join(columns) if columns else "*"
-            where_clause = " AND ".join(f"{key} = ${i+1}" for i, key in enumerate(where.keys())) if where else "1=1"
-            query = f"SELECT {columns_clause} FROM {self.name} WHERE {where_clause}"
-            
-            query_values = list(where.values())
-
-            connection = await self._get_connection()
-            # if connection is busy wait 1 second and try again
-            if not isinstance(self.connection.connection, asyncpg.pool.Pool):
-                for i in range(5):
-                    if connection.is_in_transaction():
-                        await asyncio.sleep(1)
-                    else:
-                        break
-                if connection.is_in_transaction():
-                    raise Exception("Connection is busy")
-            rows = await connection.fetch(query, *query_values, timeout=self.timeout)
+            columns_clause = self._columns_clause(columns)
+            where_clause = self._where_sql(tuple(where))
+            query = f"SELECT {columns_clause} FROM {self._quoted_name} WHERE {where_clause}"
+            query += self._page_sql(order_by, order, limit, offset)
 
-            if self.cache:
-                for row in rows:
-                    cache_key = self._get_cache_key(**row)
-                    if cache_key:
-                        self.caches[cache_key] = row
+            query_values = where.values()
+
+            async with self._acquire() as connection:
+                statement = await self._prepare_cached(connection, ("select", columns, tuple(where), limit, offset, order_by, order), query)
+                if statement is not None:
+                    rows = await statement.fetch(*query_values, timeout=self.timeout)
+                else:
+                    rows = await connection.fetch(query, *query_values, timeout=self.timeout)
+
+            # Mirror the read-side gate: projected or LIMITed results are
+            # partial and must not be served later as full rows.
+            if self.cache and not columns and limit is None and rows and len(rows) <= self.cache_insert_threshold and self.cache_key in rows[0].keys():
+                cache_key_name = self.cache_key
+                self.caches.update((str(row[cache_key_name]), row) for row in rows)
             return rows
         except asyncpg.PostgresError as e:
-            print(f"Failed to select from table {self.name}: {e}")
+            logger.error("Failed to select from table %s: %s", self.name, e)
             return None
-        except Exception as e:
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("Unexpected error on table %s", self.name)
             return None
-        finally:
-            if connection and isinstance(self.connection.connection, asyncpg.pool.Pool):
-                await connection.close()
 
                 
     async def get(self, **where):
@@ -340,131 +738,168 @@ class Table:
         :return: The selected row.
         """
         try:
-            # Validate and convert types
-            for column in self.columns:
-                if column.name in where:
-                    if isinstance(where[column.name], str) and column.type in ["INTEGER", "BIGINT"]:
-                        where[column.name] = int(where[column.name])
-                    elif isinstance(where[column.name], str) and column.type == "BOOLEAN":
-                        where[column.name] = where[column.name].lower() in ["true", "1", "yes"]
+            # Coerce string values for typed columns via the precomputed
+            # table — one dict lookup per key instead of a column scan.
+            if self._coercers:
+                for key in where:
+                    coerce = self._coercers.get(key)
+                    if coerce is not None:
+                        where[key] = coerce(where[key])
 
             cache_key = self._get_cache_key(**where)
-            if self.cache and cache_key and cache_key in self.caches:
-                return self.caches[cache_key]
-            
-            where_clause = " AND ".join(f"{key} = ${i+1}" for i, key in enumerate(where.keys())) if where else "1=1"
-            query = f"SELECT * FROM {self.name} WHERE {where_clause}"
-            query_values = list(where.values())
-            connection = await self._get_connection()
-            # if connection is busy wait 1 second and try again
-            if not isinstance(self.connection.connection, asyncpg.pool.Pool):
-                for i in range(5):
-                    if connection.is_in_transaction():
-                        await asyncio.sleep(1)
-                    else:
-                        break
-                if connection.is_in_transaction():
-                    raise Exception("Connection is busy")
-            row = await connection.fetchrow(query, *query_values, timeout=self.timeout)
-
-            if self.cache and row:
-                cache_key = self._get_cache_key(**row)
-                if cache_key:
-                    self.caches[cache_key] = row
+            if self.cache and cache_key:
+                cached = self.caches.get(cache_key)
+                if cached is _MISS:
+                    return None
+                if cached is not None:
+                    return cached
+
+            where_clause = self._where_sql(tuple(where))
+            query = self._sql_select_prefix + where_clause
+            query_values = where.values()
+            async with self._acquire() as connection:
+                statement = await self._prepare_cached(connection, ("get", tuple(where)), query)
+                if statement is not None:
+                    row = await statement.fetchrow(*query_values, timeout=self.timeout)
+                else:
+                    row = await connection.fetchrow(query, *query_values, timeout=self.timeout)
+
+            if self.cache:
+                if row is not None:
+                    cache_key = self._cache_key_of(row)
+                    if cache_key:
+                        self.caches[cache_key] = row
+                elif cache_key and self.cache_ttl:
+                    # Cache the miss too, so repeated lookups for an
+                    # absent key stop hitting the database — but only
+                    # when a TTL bounds the staleness. Without one a
+                    # cached miss would hide a row inserted by another
+                    # process indefinitely.
+                    self.caches[cache_key] = _MISS
             return row
         except asyncpg.PostgresError as e:
-            print(f"Failed to get row from table {self.name}: {e}")
+            logger.error("Failed to get row from table %s: %s", self.name, e)
             return None
         except ValueError as e:
-            print(f"ValueError: {e}")
+            logger.error("ValueError: %s", e)
             return None
-        except Exception as e:
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("Unexpected error on table %s", self.name)
             return None
-        finally:
-            if connection and isinstance(self.connection.connection, asyncpg.pool.Pool):
-                await connection.close()
 
                 
-    async def gets(self, **where):
+    async def multi_get(self, wheres: List[Dict[str, Any]]):
+        """
+        Gets multiple single rows concurrently.
+
+        Each lookup runs as its own coroutine via asyncio.gather, so with a
+        connection pool the round-trips overlap instead of executing one
+        after another.
+
+        :param wheres: A list of condition dictionaries, one per lookup.
+        :return: The rows in the same order as the conditions.
+        """
+        return await asyncio.gather(*(self.get(**where) for where in wheres))
+
+    async def gets(self, limit: Optional[int] = None, offset: Optional[int] = None, order_by: Optional[str] = None, order: str = 'ASC', **where):
         """
         Gets multiple rows from the table.
 
+        :param limit: The maximum number of rows to return.
+        :param offset: The number of rows to skip.
+        :param order_by: The column to order the results by.
+        :param order: The order direction ('ASC' or 'DESC').
         :param where: A dictionary specifying the conditions for the rows to get.
         :raises RuntimeError: If there is a database error.
         :return: The selected rows.
         """
         try:
             cache_key = self._get_cache_key(**where)
-            if self.cache and cache_key and cache_key in self.caches:
-                return [self.caches[cache_key]]
-            
-            where_clause = " AND ".join(f"{key} = ${i+1}" for i, key in enumerate(where.keys())) if where else "1=1"
-            query = f"SELECT * FROM {self.name} WHERE {where_clause}"
-
-            query_values = list(where.values())
-
-            connection = await self._get_connection()
-            # if connection is busy wait 1 second and try again
-            if not isinstance(self.connection.connection, asyncpg.pool.Pool):
-                for i in range(5):
-                    if connection.is_in_transaction():
-                        await asyncio.sleep(1)
-                    else:
-                        break
-                if connection.is_in_transaction():
-                    raise Exception("Connection is busy")
-            rows = await connection.fetch(query, *query_values, timeout=self.timeout)
+            if self.cache and limit is None and offset is None and order_by is None and cache_key:
+                cached = self.caches.get(cache_key)
+                if cached is not None and cached is not _MISS:
+                    return [cached]
 
-            if self.cache:
-                for row in rows:
-                    cache_key = self._get_cache_key(**row)
-                    if cache_key:
-                        self.caches[cache_key] = row
+            where_clause = self._where_sql(tuple(where))
+            query = self._sql_select_prefix + where_clause
+            query += self._page_sql(order_by, order, limit, offset)
+
+            query_values = where.values()
+
+            async with self._acquire() as connection:
+                statement = await self._prepare_cached(connection, ("gets", tuple(where), limit, offset, order_by, order), query)
+                if statement is not None:
+                    rows = await statement.fetch(*query_values, timeout=self.timeout)
+                else:
+                    rows = await connection.fetch(query, *query_values, timeout=self.timeout)
+
+            if self.cache and rows and len(rows) <= self.cache_insert_threshold and self.cache_key in rows[0].keys():
+                cache_key_name = self.cache_key
+                self.caches.update((str(row[cache_key_name]), row) for row in rows)
             return rows
         except asyncpg.PostgresError as e:
-            print(f"Failed to get rows from table {self.name}: {e}")
+            logger.error("Failed to get rows from table %s: %s", self.name, e)
             return None
-        except Exception as e:
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("Unexpected error on table %s", self.name)
             return None
-        finally:
-            if connection and isinstance(self.connection.connection, asyncpg.pool.Pool):
-                await connection.close()
 
                 
-    async def get_all(self):
+    async def get_all(self, limit: Optional[int] = None, offset: Optional[int] = None, order_by: Optional[str] = None, order: str = 'ASC'):
         """
         Gets all rows from the table.
 
+        :param limit: The maximum number of rows to return.
+        :param offset: The number of rows to skip.
+        :param order_by: The column to order the results by.
+        :param order: The order direction ('ASC' or 'DESC').
         :raises RuntimeError: If there is a database error.
         :return: The selected rows.
         """
         try:
-            query = f"SELECT * FROM {self.name}"
-            connection = await self._get_connection()
-            # if connection is busy wait 1 second and try again
-            if not isinstance(self.connection.connection, asyncpg.pool.Pool):
-                for i in range(5):
-                    if connection.is_in_transaction():
-                        await asyncio.sleep(1)
-                    else:
-                        break
-                if connection.is_in_transaction():
-                    raise Exception("Connection is busy")
-            rows = await connection.fetch(query, timeout=self.timeout)
+            query = f"SELECT * FROM {self._quoted_name}"
+            query += self._page_sql(order_by, order, limit, offset)
+            async with self._acquire() as connection:
+                rows = await connection.fetch(query, timeout=self.timeout)
+            if rows is not None and len(rows) > 10000:
+                logger.warning(
+                    "get_all on table %s materialized %d rows; consider iter_all() to stream them in bounded memory",
+                    self.name, len(rows)
+                )
             return rows
         except asyncpg.PostgresError as e:
-            print(f"Failed to get all rows from table {self.name}: {e}")
+            logger.error("Failed to get all rows from table %s: %s", self.name, e)
             return None
-        except Exception as e:
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("Unexpected error on table %s", self.name)
             return None
-        finally:
-            if connection and isinstance(self.connection.connection, asyncpg.pool.Pool):
-                await connection.close()
 
-                
+    
+    async def iter_all(self, prefetch: int = 1000):
+        """
+        Iterates over all rows in the table using a server-side cursor.
+
+        Unlike :meth:`get_all`, rows are streamed in batches of ``prefetch``
+        instead of being materialized in one list, so peak memory stays
+        bounded regardless of table size. Database errors propagate to the
+        consumer rather than being swallowed, since a generator cannot
+        meaningfully return None.
+
+        In single-connection mode the connection lock is held for the
+        whole iteration, so calling any other table method from inside
+        the ``async for`` body deadlocks. Do other database work after
+        the loop, or use a connection pool, where each iterator gets its
+        own connection.
+
+        :param prefetch: The number of rows to fetch per batch.
+        :return: An async iterator over the rows.
+        """
+        query = f"SELECT * FROM {self._quoted_name}"
+        async with self._acquire() as connection:
+            async with connection.transaction():
+                async for row in connection.cursor(query, prefetch=prefetch, timeout=self.timeout):
+                    yield row
+
     async def count(self, **where):
         """
         Counts the number of rows in the table.
@@ -474,32 +909,24 @@ class Table:
         :return: The count of rows.
         """
         try:
-            where_clause = " AND ".join(f"{key} = ${i+1}" for i, key in enumerate(where.keys())) if where else "1=1"
-            query = f"SELECT COUNT(*) FROM {self.name} WHERE {where_clause}"
+            where_clause = self._where_sql(tuple(where))
+            query = self._sql_count_prefix + where_clause
             
-            query_values = list(where.values())
-
-            connection = await self._get_connection()
-            # if connection is busy wait 1 second and try again
-            if not isinstance(self.connection.connection, asyncpg.pool.Pool):
-                for i in range(5):
-                    if connection.is_in_transaction():
-                        await asyncio.sleep(1)
-                    else:
-                        break
-                if connection.is_in_transaction():
-                    raise Exception("Connection is busy")
-            count = await connection.fetchval(query, *query_values, timeout=self.timeout)
-            return count
+            query_values = where.values()
+
+            async with self._acquire() as connection:
+                statement = await self._prepare_cached(connection, ("count", tuple(where)), query)
+                if statement is not None:
+                    count = await statement.fetchval(*query_values, timeout=self.timeout)
+                else:
+                    count = await connection.fetchval(query, *query_values, timeout=self.timeout)
+                return count if count is not None else 0
         except asyncpg.PostgresError as e:
-            print(f"Failed to count rows in table {self.name}: {e}")
+            logger.error("Failed to count rows in table %s: %s", self.name, e)
             return None
-        except Exception as e:
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("Unexpected error on table %s", self.name)
             return None
-        finally:
-            if connection and isinstance(self.connection.connection, asyncpg.pool.Pool):
-                await connection.close()
 
                 
     async def exists(self, **where):
@@ -511,35 +938,36 @@ class Table:
         :return: True if any rows exist, False otherwise.
         """
         try:
-            where_clause = " AND ".join(f"{key} = ${i+1}" for i, key in enumerate(where.keys())) if where else "1=1"
-            query = f"SELECT EXISTS (SELECT 1 FROM {self.name} WHERE {where_clause})"
+            where_clause = self._where_sql(tuple(where))
+            query = self._sql_exists_prefix + where_clause + ")"
             
-            query_values = list(where.values())
-
-            connection = await self._get_connection()
-            # if connection is busy wait 1 second and try again
-            if not isinstance(self.connection.connection, asyncpg.pool.Pool):
-                for i in range(5):
-                    if connection.is_in_transaction():
-                        await asyncio.sleep(1)
-                    else:
-                        break
-                if connection.is_in_transaction():
-                    raise Exception("Connection is busy")
-            exists = await connection.fetchval(query, *query_values, timeout=self.timeout)
-            return exists
+            query_values = where.values()
+
+            async with self._acquire() as connection:
+                statement = await self._prepare_cached(connection, ("exists", tuple(where)), query)
+                if statement is not None:
+                    exists = await statement.fetchval(*query_values, timeout=self.timeout)
+                else:
+                    exists = await connection.fetchval(query, *query_values, timeout=self.timeout)
+                return exists
         except asyncpg.PostgresError as e:
-            print(f"Failed to check existence in table {self.name}: {e}")
+            logger.error("Failed to check existence in table %s: %s", self.name, e)
             return None
-        except Exception as e:
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("Unexpected error on table %s", self.name)
             return None
-        finally:
-            if connection and isinstance(self.connection.connection, asyncpg.pool.Pool):
-                await connection.close()
 
-                
-    
+    async def any(self, **where):
+        """
+        Checks if any rows exist in the table that match the conditions.
+        Alias of :meth:`exists`, which short-circuits on the first match
+        instead of counting the whole matching set.
+
+        :param where: A dictionary specifying the conditions for the rows to check.
+        :return: True if any rows exist, False otherwise.
+        """
+        return await self.exists(**where)
+
     async def get_page(self, page: int = 1, limit: int = 10, where: Dict[str, Any] = None, order_by: str = None, order: str = 'ASC'):
         """
         Gets a paginated set of rows from the table.
@@ -554,41 +982,238 @@ class Table:
         """
         try:
             offset = (page - 1) * limit
-            where_clause = " AND ".join(f"{key} = ${i+1}" for i, key in enumerate(where.keys())) if where else "1=1"
-            order_clause = f"ORDER BY {order_by} {order}" if order_by else ""
-            query = f"SELECT * FROM {self.name} WHERE {where_clause} {order_clause} LIMIT {limit} OFFSET {offset}"
-    
-            query_values = list(where.values()) if where else []
+            where_clause = self._where_sql(tuple(where) if where else ())
+            query = f"SELECT * FROM {self._quoted_name} WHERE {where_clause}"
+            query += self._page_sql(order_by, order, limit, offset)
     
-            connection = await self._get_connection()
-            # if connection is busy wait 1 second and try again
-            if not isinstance(self.connection.connection, asyncpg.pool.Pool):
-                for i in range(5):
-                    if connection.is_in_transaction():
-                        await asyncio.sleep(1)
-                    else:
-                        break
-                if connection.is_in_transaction():
-                    raise Exception("Connection is busy")
-            rows = await connection.fetch(query, *query_values, timeout=self.timeout)
+            query_values = where.values() if where else ()
     
-            if self.cache:
+            async with self._acquire() as connection:
+                rows = await connection.fetch(query, *query_values, timeout=self.timeout)
+
+            if self.cache and len(rows) <= self.cache_insert_threshold:
                 for row in rows:
-                    cache_key = self._get_cache_key(**row)
+                    cache_key = self._cache_key_of(row)
                     if cache_key:
                         self.caches[cache_key] = row
             return rows
         except asyncpg.PostgresError as e:
-            print(f"Failed to get paginated rows from table {self.name}: {e}")
+            logger.error("Failed to get paginated rows from table %s: %s", self.name, e)
             return None
-        except Exception as e:
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("Unexpected error on table %s", self.name)
+            return None
+
+    def _search_sql(self, keyword: str, by, mode: str):
+        """
+        Returns the search condition SQL and its single bound value for the
+        given columns and mode.
+
+        ``ilike`` ORs a case-insensitive substring match across the columns;
+        ``fts`` matches a tsvector over the concatenated columns against
+        ``plainto_tsquery``, which a :meth:`create_fts_index` index serves
+        as an index probe instead of a scan.
+
+        The clause is memoized per (mode, columns) shape, so repeated
+        searches reuse a constant string and only bind a fresh value.
+        """
+        key = ("search", mode, tuple(by))
+        clause = self._sql_cache.get(key)
+        if clause is None:
+            if mode == "fts":
+                document = " || ' ' || ".join(f"coalesce({self._q(column)}::text, '')" for column in by)
+                clause = f"to_tsvector('simple', {document}) @@ plainto_tsquery('simple', $1)"
+            elif mode == "ilike":
+                # Text columns skip the ::text cast so a plain index on the
+                # column (e.g. gin_trgm_ops) stays usable by the planner.
+                clause = " OR ".join(
+                    f"{self._q(column)} ILIKE $1" if column in self._text_cols
+                    else f"{self._q(column)}::text ILIKE $1"
+                    for column in by
+                )
+            else:
+                raise ValueError(f"Invalid search mode: {mode}")
+            self._sql_cache[key] = clause
+        return clause, (keyword if mode == "fts" else f"%{keyword}%")
+
+    async def create_fts_index(self, by: List[str]):
+        """
+        Creates the expression GIN index matching ``search(mode="fts")``
+        over the given columns.
+
+        :param by: The columns the full-text searches cover, in the same
+            order they are passed to search().
+        :raises RuntimeError: If there is a database error.
+        :return: True on success.
+        """
+        try:
+            for column in by:
+                if not _IDENT(column):
+                    raise ValueError(f"Invalid column name: {column}")
+            document = " || ' ' || ".join(f"coalesce({self._q(column)}::text, '')" for column in by)
+            index_name = f"{self.name}_{'_'.join(by)}_fts_idx"
+            query = (
+                f"CREATE INDEX IF NOT EXISTS {index_name} ON {self._quoted_name} "
+                f"USING gin (to_tsvector('simple', {document}));"
+            )
+            async with self._acquire() as connection:
+                await connection.execute(query, timeout=self.timeout)
+            return True
+        except asyncpg.PostgresError as e:
+            logger.error("Failed to create full-text index on table %s: %s", self.name, e)
+            return None
+        except ValueError as e:
+            logger.error("ValueError: %s", e)
+            return None
+        except Exception:
+            logger.exception("Unexpected error on table %s", self.name)
+            return None
+
+    async def search(self, keyword: str, by: List[str], where: Dict[str, Any] = None, limit: int = None, offset: int = None, order_by: str = None, order: str = 'ASC', mode: str = 'ilike'):
+        """
+        Searches the table for rows where any of the ``by`` columns matches
+        the keyword.
+
+        :param keyword: The keyword to search for.
+        :param by: The columns to search in.
+        :param where: A dictionary of extra conditions; values may be
+            plain values (equality) or :class:`Filter` instances such as
+            ``Between``, ``Like`` and ``In``.
+        :param limit: The maximum number of rows to return.
+        :param offset: The number of rows to skip.
+        :param order_by: The column to order the results by.
+        :param order: The order direction ('ASC' or 'DESC').
+        :param mode: 'ilike' (substring match, default) or 'fts' (full-text
+            search; pair with :meth:`create_fts_index`).
+        :raises RuntimeError: If there is a database error.
+        :return: The matching rows.
+        """
+        try:
+            search_clause, search_value = self._search_sql(keyword, by, mode)
+            query_values = [search_value]
+            # The where clause is numbered past the parameters already bound,
+            # so it never needs a renumbering pass.
+            where_clause, where_values = self._build_where_clause(where, start_index=len(query_values))
+            query_values.extend(where_values)
+            query = f"SELECT * FROM {self._quoted_name} WHERE ({search_clause}) AND ({where_clause})"
+            query += self._page_sql(order_by=order_by, order=order, limit=limit, offset=offset)
+
+            async with self._acquire() as connection:
+                statement = await self._prepare_cached(connection, ("search", mode, tuple(by), tuple(where) if where else (), order_by, order, limit, offset), query)
+                if statement is not None:
+                    return await statement.fetch(*query_values, timeout=self.timeout)
+                return await connection.fetch(query, *query_values, timeout=self.timeout)
+        except asyncpg.PostgresError as e:
+            logger.error("Failed to search table %s: %s", self.name, e)
+            return None
+        except ValueError as e:
+            logger.error("ValueError: %s", e)
+            return None
+        except Exception:
+            logger.exception("Unexpected error on table %s", self.name)
+            return None
+
+    async def search_iter(self, keyword: str, by: List[str], where: Dict[str, Any] = None, order_by: str = None, order: str = 'ASC', mode: str = 'ilike', prefetch: int = 1000):
+        """
+        Like :meth:`search`, but streams matches through a server-side
+        cursor instead of materializing the whole result set, so peak
+        memory stays bounded by ``prefetch`` regardless of how many rows
+        match. Database errors propagate to the consumer rather than being
+        swallowed, since a generator cannot meaningfully return None.
+
+        :param keyword: The keyword to search for.
+        :param by: The columns to search in.
+        :param where: A dictionary of extra conditions; values may be
+            plain values (equality) or :class:`Filter` instances.
+        :param order_by: The column to order the results by.
+        :param order: The order direction ('ASC' or 'DESC').
+        :param mode: 'ilike' (substring match, default) or 'fts'.
+        :param prefetch: The number of rows to fetch per batch.
+        :return: An async iterator over the matching rows.
+
+        In single-connection mode the connection lock is held for the
+        whole iteration — see :meth:`iter_all` for the deadlock hazard
+        and how to avoid it.
+        """
+        search_clause, search_value = self._search_sql(keyword, by, mode)
+        query_values = [search_value]
+        where_clause, where_values = self._build_where_clause(where, start_index=len(query_values))
+        query_values.extend(where_values)
+        query = f"SELECT * FROM {self._quoted_name} WHERE ({search_clause}) AND ({where_clause})"
+        query += self._page_sql(order_by=order_by, order=order)
+
+        async with self._acquire() as connection:
+            async with connection.transaction():
+                async for row in connection.cursor(query, *query_values, prefetch=prefetch, timeout=self.timeout):
+                    yield row
+
+    async def search_with_count(self, keyword: str, by: List[str], where: Dict[str, Any] = None, limit: int = None, offset: int = None, order_by: str = None, order: str = 'ASC', mode: str = 'ilike', approximate: bool = False):
+        """
+        Runs :meth:`search` and :meth:`count_search` concurrently and
+        returns (rows, total). With a connection pool the two queries run
+        on separate connections, so a paginated list endpoint pays
+        max(t_search, t_count) instead of their sum.
+
+        :param approximate: Passed through to count_search.
+        :return: A (rows, total) tuple.
+        """
+        return await asyncio.gather(
+            self.search(keyword, by, where=where, limit=limit, offset=offset, order_by=order_by, order=order, mode=mode),
+            self.count_search(keyword, by, where=where, mode=mode, approximate=approximate),
+        )
+
+    async def count_search(self, keyword: str, by: List[str], where: Dict[str, Any] = None, mode: str = 'ilike', approximate: bool = False):
+        """
+        Counts the rows where any of the ``by`` columns matches the keyword.
+
+        :param keyword: The keyword to search for.
+        :param by: The columns to search in.
+        :param where: A dictionary of extra conditions; values may be
+            plain values (equality) or :class:`Filter` instances.
+        :param mode: 'ilike' (substring match, default) or 'fts'.
+        :param approximate: When True, return the planner's row estimate
+            from EXPLAIN instead of scanning every match — O(1) instead of
+            O(matches), at the cost of accuracy. Good enough for pagination
+            displays on large tables.
+        :raises RuntimeError: If there is a database error.
+        :return: The number of matching rows.
+        """
+        try:
+            search_clause, search_value = self._search_sql(keyword, by, mode)
+            query_values = [search_value]
+            where_clause, where_values = self._build_where_clause(where, start_index=len(query_values))
+            query_values.extend(where_values)
+
+            if approximate:
+                explain_query = (
+                    f"EXPLAIN (FORMAT JSON) SELECT * FROM {self._quoted_name} "
+                    f"WHERE ({search_clause}) AND ({where_clause})"
+                )
+                async with self._acquire() as connection:
+                    plan = await connection.fetchval(explain_query, *query_values, timeout=self.timeout)
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                return int(plan[0]["Plan"]["Plan Rows"])
+
+            query = f"SELECT COUNT(*) FROM {self._quoted_name} WHERE ({search_clause}) AND ({where_clause})"
+
+            async with self._acquire() as connection:
+                statement = await self._prepare_cached(connection, ("count_search", mode, tuple(by), tuple(where) if where else ()), query)
+                if statement is not None:
+                    count = await statement.fetchval(*query_values, timeout=self.timeout)
+                else:
+                    count = await connection.fetchval(query, *query_values, timeout=self.timeout)
+                return count if count is not None else 0
+        except asyncpg.PostgresError as e:
+            logger.error("Failed to count search results in table %s: %s", self.name, e)
+            return None
+        except ValueError as e:
+            logger.error("ValueError: %s", e)
+            return None
+        except Exception:
+            logger.exception("Unexpected error on table %s", self.name)
             return None
-        finally:
-            if connection and isinstance(self.connection.connection, asyncpg.pool.Pool):
-                await connection.close()
 
-                
     async def query(self, query: str, *args):
         """
         Executes a custom query on the table.
@@ -599,27 +1224,15 @@ class Table:
         :return: The query result.
         """
         try:
-            connection = await self._get_connection()
-            # if connection is busy wait 1 second and try again
-            if not isinstance(self.connection.connection, asyncpg.pool.Pool):
-                for i in range(5):
-                    if connection.is_in_transaction():
-                        await asyncio.sleep(1)
-                    else:
-                        break
-                if connection.is_in_transaction():
-                    raise Exception("Connection is busy")
-            result = await connection.fetch(query, *args, timeout=self.timeout)
-            return result
+            async with self._acquire() as connection:
+                result = await connection.fetch(query, *args, timeout=self.timeout)
+                return result
         except asyncpg.PostgresError as e:
-            print(f"Failed to execute query on table {self.name}: {e}")
+            logger.error("Failed to execute query on table %s: %s", self.name, e)
             return None
-        except Exception as e:
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("Unexpected error on table %s", self.name)
             return None
-        finally:
-            if connection and isinstance(self.connection.connection, asyncpg.pool.Pool):
-                await connection.close()
 
                 
 
@@ -629,35 +1242,38 @@ class Table:
         Retrieves the column names and types for the table.
 
         :raises RuntimeError: If there is a database error.
-        :return: A list of dictionaries containing column names and types.
+        :return: A list of (name, type) tuples. Earlier versions returned
+            dictionaries; tuples avoid a per-column dict allocation just to
+            rename the record keys.
         """
         try:
-            query = f"""
-            SELECT column_name, data_type 
-            FROM information_schema.columns 
-            WHERE table_name = '{self.name}';
+            cached = self._columns_cache
+            if cached is not None and time.monotonic() - cached[0] < self._columns_ttl:
+                return cached[1]
+
+            query = """
+            SELECT column_name, data_type
+            FROM information_schema.columns
+            WHERE table_schema = 'public' AND table_name = $1
+            ORDER BY ordinal_position;
             """
-            connection = await self._get_connection()
-            # if connection is busy wait 1 second and try again
-            if not isinstance(self.connection.connection, asyncpg.pool.Pool):
-                for i in range(5):
-                    if connection.is_in_transaction():
-                        await asyncio.sleep(1)
-                    else:
-                        break
-                if connection.is_in_transaction():
-                    raise Exception("Connection is busy")
-            columns = await connection.fetch(query, timeout=self.timeout)
-            return [{"name": column["column_name"], "type": column["data_type"]} for column in columns]
+            async with self._acquire() as connection:
+                statement = await self._prepare_cached(connection, ("get_columns",), query)
+                if statement is not None:
+                    columns = await statement.fetch(self.name, timeout=self.timeout)
+                else:
+                    columns = await connection.fetch(query, self.name, timeout=self.timeout)
+            # Marshal after release so the connection goes back to the pool
+            # while the result list is being built.
+            result = [(column[0], column[1]) for column in columns]
+            self._columns_cache = (time.monotonic(), result)
+            return result
         except asyncpg.PostgresError as e:
-            print(f"Failed to get columns for table {self.name}: {e}")
+            logger.error("Failed to get columns for table %s: %s", self.name, e)
             return None
-        except Exception as e:
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("Unexpected error on table %s", self.name)
             return None
-        finally:
-            if connection and isinstance(self.connection.connection, asyncpg.pool.Pool):
-                await connection.close()
 
                 
     def __repr__(self) -> str:
@@ -673,10 +1289,7 @@ class Table:
         :param key: The name of the column.
         :return: The Column object if found, otherwise None.
         """
-        for column in self.columns:
-            if column.name == key:
-                return column
-        return None
+        return self._columns_by_name.get(key)
     
     def __setitem__(self, key: str, value: Column):
         """
@@ -685,11 +1298,14 @@ class Table:
         :param key: The name of the column.
         :param value: The Column object to set.
         """
-        for i, column in enumerate(self.columns):
-            if column.name == key:
-                self.columns[i] = value
-                return
-        self.columns.append(value)
+        if not _IDENT(value.name):
+            raise ValueError(f"Invalid column name: {value.name}")
+        index = self._col_index.get(key)
+        if index is not None:
+            self.columns[index] = value
+        else:
+            self.columns.append(value)
+        self._refresh_column_lookups()
 
     def __delitem__(self, key: str):
         """
@@ -698,12 +1314,24 @@ class Table:
         :param key: The name of the column.
         :raises KeyError: If the column is not found.
         """
-        for i, column in enumerate(self.columns):
-            if column.name == key:
-                del self.columns[i]
-                return
-        raise KeyError(f"Column {key} not found")
+        index = self._col_index.get(key)
+        if index is None:
+            raise KeyError(f"Column {key} not found")
+        del self.columns[index]
+        self._refresh_column_lookups()
     
+    async def _execute_simple(self, query):
+        """
+        Executes a statement whose result is discarded. On a pool this
+        goes through Pool.execute, which acquires and releases internally,
+        skipping the Python-level acquire/release round-trip.
+        """
+        if self._is_pool and self.connection.connection is not None:
+            await self.connection.connection.execute(query, timeout=self.timeout)
+        else:
+            async with self._acquire() as connection:
+                await connection.execute(query, timeout=self.timeout)
+
     async def drop(self):
         """
         Drops the table from the PostgreSQL database.
@@ -711,56 +1339,120 @@ class Table:
         :raises RuntimeError: If there is a database error.
         """
         try:
-            connection = await self._get_connection()
-            # if connection is busy wait 1 second and try again
-            if not isinstance(self.connection.connection, asyncpg.pool.Pool):
-                for i in range(5):
-                    if connection.is_in_transaction():
-                        await asyncio.sleep(1)
-                    else:
-                        break
-                if connection.is_in_transaction():
-                    raise Exception("Connection is busy")
-            query = f"DROP TABLE IF EXISTS {self.name};"
-            await connection.execute(query, timeout=self.timeout)
+            await self._execute_simple(self._drop_sql)
+            self._stmt_cache.clear()
+            self._columns_cache = None
+            if self.cache:
+                self.caches.clear()
         except asyncpg.PostgresError as e:
-            print(f"Failed to drop table {self.name}: {e}")
+            logger.error("Failed to drop table %s: %s", self.name, e)
             return None
-        except Exception as e:
-            print(traceback.format_exc())
+        except (OSError, asyncio.TimeoutError):
+            # Connection-level failures keep the return-None contract;
+            # programming errors and cancellation propagate to the caller.
+            logger.exception("Failed to drop table %s", self.name)
             return None
-        finally:
-            if connection and isinstance(self.connection.connection, asyncpg.pool.Pool):
-                await connection.close()
 
                 
-    async def truncate(self):
+    async def truncate(self, restart_identity: bool = False, cascade: bool = False):
         """
         Truncates the table to remove all rows.
 
+        :param restart_identity: Whether to reset sequences owned by the
+            table's columns, so SERIAL counters start over from 1.
+        :param cascade: Whether to also truncate tables with foreign keys
+            referencing this one. Off by default — it silently empties
+            other tables.
         :raises RuntimeError: If there is a database error.
         """
         try:
-            connection = await self._get_connection()
-            # if connection is busy wait 1 second and try again
-            if not isinstance(self.connection.connection, asyncpg.pool.Pool):
-                for i in range(5):
-                    if connection.is_in_transaction():
-                        await asyncio.sleep(1)
-                    else:
-                        break
-                if connection.is_in_transaction():
-                    raise Exception("Connection is busy")
-            query = f"TRUNCATE TABLE {self.name};"
-            await connection.execute(query, timeout=self.timeout)
+            if restart_identity or cascade:
+                query = (
+                    f"TRUNCATE TABLE {self._quoted_name}"
+                    f"{' RESTART IDENTITY' if restart_identity else ''}"
+                    f"{' CASCADE' if cascade else ''};"
+                )
+            else:
+                query = self._truncate_sql
+            await self._execute_simple(query)
+            if self.cache:
+                self.caches.clear()
         except asyncpg.PostgresError as e:
-            print(f"Failed to truncate table {self.name}: {e}")
+            logger.error("Failed to truncate table %s: %s", self.name, e)
+            return None
+        except (OSError, asyncio.TimeoutError):
+            logger.exception("Failed to truncate table %s", self.name)
+            return None
+
+    @classmethod
+    async def truncate_many(cls, tables: List["Table"]):
+        """
+        Truncates several tables with one statement. PostgreSQL accepts a
+        list of tables in TRUNCATE, so N tables cost a single round-trip
+        and one transaction instead of one each.
+
+        The connection of the first table is used; all tables are expected
+        to live on the same database.
+
+        :param tables: The tables to truncate.
+        :raises ValueError: If no tables are provided.
+        :return: True on success.
+        """
+        try:
+            if not tables:
+                raise ValueError("No tables provided")
+            query = "TRUNCATE TABLE " + ", ".join(table._quoted_name for table in tables) + ";"
+            first = tables[0]
+            async with first._acquire() as connection:
+                await connection.execute(query, timeout=first.timeout)
+            for table in tables:
+                if table.cache:
+                    table.caches.clear()
+            return True
+        except asyncpg.PostgresError as e:
+            logger.error("Failed to truncate tables %s: %s", ", ".join(t.name for t in tables), e)
+            return None
+        except ValueError as e:
+            logger.error("ValueError: %s", e)
+            return None
+        except (OSError, asyncio.TimeoutError):
+            logger.exception("Failed to truncate tables")
+            return None
+
+    @classmethod
+    async def drop_many(cls, tables: List["Table"]):
+        """
+        Drops several tables with one multi-statement execute — one Parse,
+        one round-trip instead of one per table.
+
+        The connection of the first table is used; all tables are expected
+        to live on the same database.
+
+        :param tables: The tables to drop.
+        :raises ValueError: If no tables are provided.
+        :return: True on success.
+        """
+        try:
+            if not tables:
+                raise ValueError("No tables provided")
+            query = " ".join(f"DROP TABLE IF EXISTS {table._quoted_name};" for table in tables)
+            first = tables[0]
+            async with first._acquire() as connection:
+                await connection.execute(query, timeout=first.timeout)
+            for table in tables:
+                table._stmt_cache.clear()
+                table._columns_cache = None
+                if table.cache:
+                    table.caches.clear()
+            return True
+        except asyncpg.PostgresError as e:
+            logger.error("Failed to drop tables %s: %s", ", ".join(t.name for t in tables), e)
+            return None
+        except ValueError as e:
+            logger.error("ValueError: %s", e)
             return None
-        except Exception as e:
-            print(traceback.format_exc())
+        except (OSError, asyncio.TimeoutError):
+            logger.exception("Failed to drop tables")
             return None
-        finally:
-            if connection and isinstance(self.connection.connection, asyncpg.pool.Pool):
-                await connection.close()
 
                 
\ No newline at end of file
@@ -1,4 +1,18 @@
+import os
+import sys
+
+# uvloop speeds up every network-bound call asyncpg makes. Install it
+# opportunistically when present; set PGCONNECT_NO_UVLOOP=1 to keep the
+# default event loop (e.g. when another library manages the loop policy).
+if sys.platform != "win32" and not os.environ.get("PGCONNECT_NO_UVLOOP"):
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
 from .Connection import *
 from .DataType import *
 from .Table import *
-from .Column import *
\ No newline at end of file
+from .Column import *
+from .Filters import *
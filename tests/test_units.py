@@ -0,0 +1,143 @@
+import time
+
+import pytest
+import pgconnect
+from pgconnect.Cache import Cache
+
+
+def make_table(**kwargs):
+    connection = pgconnect.Connection(
+        host="localhost",
+        port=5432,
+        user="user",
+        password="password",
+        database="database"
+    )
+    return pgconnect.Table(
+        name="users",
+        connection=connection,
+        columns=[
+            pgconnect.Column(
+                name="id",
+                type=pgconnect.DataType.SERIAL().primary_key().not_null()
+            ),
+            pgconnect.Column(
+                name="email",
+                type=pgconnect.DataType.VARCHAR()
+            ),
+            pgconnect.Column(
+                name="age",
+                type=pgconnect.DataType.INT()
+            )
+        ],
+        **kwargs
+    )
+
+
+def test_cache_lru_eviction():
+    cache = Cache(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1  # refresh "a", making "b" the oldest
+    cache["c"] = 3
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_cache_ttl_expiry():
+    cache = Cache(maxsize=10, ttl=0.01)
+    cache["a"] = 1
+    assert cache["a"] == 1
+    time.sleep(0.02)
+    assert "a" not in cache
+    assert cache.get("a") is None
+    with pytest.raises(KeyError):
+        cache["a"]
+
+
+def test_cache_no_ttl_keeps_entries():
+    cache = Cache(maxsize=10)
+    cache["a"] = 1
+    time.sleep(0.01)
+    assert cache["a"] == 1
+
+
+def test_cache_update_and_pop():
+    cache = Cache(maxsize=3)
+    cache.update({"a": 1, "b": 2, "c": 3, "d": 4})
+    assert len(cache) == 3
+    assert "a" not in cache  # evicted once past maxsize
+    assert cache.pop("d") == 4
+    assert cache.pop("d", "missing") == "missing"
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_invalid_identifiers_rejected():
+    with pytest.raises(ValueError):
+        make_table().__class__(
+            name="users; DROP TABLE users",
+            connection=pgconnect.Connection(
+                host="h", port=5432, user="u", password="p", database="d"
+            ),
+            columns=[]
+        )
+    table = make_table()
+    with pytest.raises(ValueError):
+        table._q("email; --")
+    assert table._q("email") == '"email"'
+    assert table._q("not_a_column") == '"not_a_column"'
+
+
+def test_cache_ttl_must_be_positive():
+    with pytest.raises(ValueError):
+        make_table(cache=True, cache_key="id", cache_ttl=0)
+    with pytest.raises(ValueError):
+        make_table(cache=True, cache_key="id", cache_ttl=-5)
+    table = make_table(cache=True, cache_key="id", cache_ttl=60)
+    assert table.caches.ttl == 60
+
+
+def test_where_sql_quotes_and_numbers():
+    table = make_table()
+    assert table._where_sql(()) == "1=1"
+    assert table._where_sql(("id", "email")) == '"id" = $1 AND "email" = $2'
+
+
+def test_build_where_clause_equality_and_filters():
+    table = make_table()
+    clause, values = table._build_where_clause({"id": 1, "email": "a"})
+    assert clause == '"id" = $1 AND "email" = $2'
+    assert values == [1, "a"]
+
+    clause, values = table._build_where_clause(
+        {"age": pgconnect.Between(18, 30), "email": pgconnect.Like("%a%")},
+        start_index=1
+    )
+    assert clause == '"age" BETWEEN $2 AND $3 AND "email" ILIKE $4'
+    assert values == [18, 30, "%a%"]
+
+    clause, values = table._build_where_clause({"id": pgconnect.In([1, 2, 3])})
+    assert clause == '"id" = ANY($1)'
+    assert values == [[1, 2, 3]]
+
+
+def test_page_sql_validates_order():
+    table = make_table()
+    assert table._page_sql() == ""
+    assert table._page_sql("email", "desc", 5, 10) == ' ORDER BY "email" DESC LIMIT 5 OFFSET 10'
+    assert table._page_sql("email", "ASC NULLS LAST") == ' ORDER BY "email" ASC NULLS LAST'
+    with pytest.raises(ValueError):
+        table._page_sql("email", "DESC) bad", 1, 1)
+    with pytest.raises(ValueError):
+        table._page_sql("email; --", "ASC")
+
+
+def test_columns_clause():
+    table = make_table()
+    assert table._columns_clause(()) == "*"
+    assert table._columns_clause(("id", "email")) == '"id", "email"'
+    with pytest.raises(ValueError):
+        table._columns_clause(("id; --",))